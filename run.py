@@ -0,0 +1,110 @@
+"""
+Command-line runner for the Jira Analysis Agent
+Single issue: python run.py --issue DL-123 --language BE --update-jira
+Batch:        python run.py --batch issues.json --workers 4
+"""
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict, List
+
+from src.agent import (JiraAnalysisAgent, AgentConfig, MCPJiraClient, logger, setup_logging,
+                       _JIRA_UPDATE_WORKERS)
+
+OUTPUT_DIR = "output"
+# Streamed report pieces are coalesced into a few large writes
+REPORT_BUFFER_SIZE = 1 << 16
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Analyze Jira issues and generate code + estimates")
+    parser.add_argument("--issue", help="Jira issue ID, e.g. DL-123")
+    parser.add_argument("--language", default="BE", choices=["BE", "UI", "fullstack", "java", "angular"])
+    parser.add_argument("--max-hours", type=float, default=4.0)
+    parser.add_argument("--update-jira", action="store_true", help="Write the analysis back to Jira")
+    parser.add_argument("--assign-to", help="Assignee email when updating Jira")
+    parser.add_argument("--batch", help="JSON file with a list of {issue_id, language, max_hours, ...}")
+    parser.add_argument("--workers", type=int, default=4, help="Parallel analyses in batch mode")
+    return parser.parse_args(argv)
+
+
+def load_specs(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    """Build the run specs from the CLI, rejecting bad batch items before anything starts"""
+    defaults = {"language": args.language, "max_hours": args.max_hours,
+                "update_jira": args.update_jira, "assign_to": args.assign_to}
+
+    if not args.batch:
+        # Interactive fallback only when no issue was given on the command line
+        issue_id = args.issue or input("Jira issue ID: ").strip()
+        items = [{"issue_id": issue_id}]
+    else:
+        with open(args.batch, encoding="utf-8") as f:
+            items = json.load(f)
+        if not isinstance(items, list):
+            raise ValueError(f"{args.batch}: expected a JSON list of issues")
+
+    specs, errors = [], []
+    for i, item in enumerate(items):
+        if not isinstance(item, dict) or not item.get("issue_id"):
+            errors.append(f"item {i}: missing issue_id")
+            continue
+        spec = {**defaults, **item}
+        try:
+            spec["max_hours"] = float(spec["max_hours"])
+        except (TypeError, ValueError):
+            errors.append(f"{item['issue_id']}: invalid max_hours {spec['max_hours']!r}")
+            continue
+        specs.append(spec)
+    if errors:
+        raise ValueError("; ".join(errors))
+    return specs
+
+
+def run_one(client: MCPJiraClient, spec: Dict[str, Any]) -> bool:
+    """Analyze one issue, save its report and optionally update Jira"""
+    config = AgentConfig(language=spec["language"], max_hours=spec["max_hours"])
+    agent = JiraAnalysisAgent(config, jira_client=client)
+    try:
+        result = agent.analyze_issue(spec["issue_id"])
+    except Exception as e:
+        logger.error("❌ %s: %s", spec["issue_id"], e)
+        return False
+
+    path = os.path.join(OUTPUT_DIR, f"{spec['issue_id']}_analysis.md")
+    with open(path, "w", encoding="utf-8", buffering=REPORT_BUFFER_SIZE) as f:
+        agent.write_report(result, f)
+    logger.info("📄 Report saved: %s", path)
+
+    if spec.get("update_jira"):
+        return agent.update_jira_with_analysis(result, assign_to=spec.get("assign_to"))
+    return True
+
+
+def main(argv: List[str]) -> int:
+    args = parse_args(argv)
+    setup_logging()
+    try:
+        specs = load_specs(args)
+    except (OSError, ValueError) as e:
+        logger.error("❌ %s", e)
+        return 2
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    # One client per run: all workers share its connection pool, response cache and field map.
+    # Each worker fans its Jira update out over several threads, so the pool is sized for all of them.
+    workers = max(1, args.workers)
+    with MCPJiraClient(AgentConfig.jira_provider, AgentConfig.jira_cache_ttl,
+                       pool_size=workers * _JIRA_UPDATE_WORKERS) as client, \
+            ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(partial(run_one, client), specs))
+
+    # Goes through the logger so it lands after every queued worker line
+    logger.info("\n✅ %d/%d issue(s) completed", sum(results), len(results))
+    return 0 if all(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -6,11 +6,13 @@ from .agent import (
     AgentConfig,
     JiraIssue,
     PseudoCode,
+    SourceFile,
     SourceCode,
     EffortEstimate,
     TaskBreakdown,
     AnalysisResult,
-    ComplexityLevel
+    ComplexityLevel,
+    setup_logging
 )
 
 __version__ = "0.1.0"
@@ -20,9 +22,11 @@ __all__ = [
     "AgentConfig",
     "JiraIssue",
     "PseudoCode",
+    "SourceFile",
     "SourceCode",
     "EffortEstimate",
     "TaskBreakdown",
     "AnalysisResult",
-    "ComplexityLevel"
+    "ComplexityLevel",
+    "setup_logging"
 ]
@@ -2,18 +2,95 @@
 Minimal Agentic AI Agent - All-in-one module
 Orchestrates Jira issue analysis, code generation, and effort estimation
 """
+import asyncio
+import base64
+import atexit
+import io
+import logging
 import os
+import queue
 import re
+import sys
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from copy import copy
 from datetime import datetime
+from functools import cached_property, lru_cache
+from itertools import islice
+from logging.handlers import QueueHandler, QueueListener
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any, Literal
+from typing import Optional, List, Dict, Any, Iterable, Literal, TextIO, Tuple, Sequence
 from enum import Enum
-from requests.auth import HTTPBasicAuth
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+    import json
+
 load_dotenv()
 
+logger = logging.getLogger("jira_agent")
+_log_listener: Optional[QueueListener] = None
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """Enqueue records unformatted; the listener thread does all formatting"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Log args are strings, numbers and exceptions, so reading them later is safe
+        return record
+
+
+def setup_logging(level: int = logging.INFO) -> None:
+    """Send agent logs to stdout via a queue, so worker threads only enqueue records"""
+    global _log_listener
+    if _log_listener is not None:
+        return
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(_DeferredQueueHandler(log_queue))
+    logger.setLevel(level)
+    logger.propagate = False
+    _log_listener = QueueListener(log_queue, handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
+# Concurrent writes in update_jira_with_analysis; the client's pool is sized to match
+_JIRA_UPDATE_WORKERS = 5
+
+# Only the Jira fields the analysis actually reads
+JIRA_ISSUE_FIELDS = "summary,description,issuetype,priority,assignee,status,labels,components"
+
+# Names that all mean the original estimate; Jira only accepts it via timetracking, never as ADF
+_ORIGINAL_ESTIMATE_NAMES = frozenset({"originalestimate", "original estimate", "timeoriginalestimate", "timetracking"})
+
+# JiraIssue kwargs and their fallbacks when missing from a client response
+_JIRA_ISSUE_DEFAULTS = {"issue_id": "", "title": "", "description": "", "issue_type": "Task",
+                        "priority": "Medium", "assignee": None, "status": "Open",
+                        "labels": [], "components": [], "raw_data": {}}
+
+# ADF payloads are only serialized, never mutated, so empty lines can share one node
+_EMPTY_PARA = {"type": "paragraph", "content": []}
+_STRONG_MARKS = [{"type": "strong"}]
+
+# Block nodes whose text ends a line in _adf_to_text
+_ADF_BLOCK_TYPES = frozenset({"paragraph", "heading", "listItem", "codeBlock", "blockquote"})
+_ADF_BLOCK_END = object()
+
+_JIRA_FILE_TEMPLATE = "// === {filename} ===\n{code}\n\n"
+
+# AgentConfig.language shorthands
+_LANG_ALIAS = {"BE": "java", "UI": "angular"}
+
+# Markdown code-fence tags by source language, or by SourceFile.type for fullstack bundles
+_CODE_TAGS = {"java": "java", "angular": "typescript", "backend": "java", "frontend": "typescript"}
+
 # ============================================================================
 # ENUMS & MODELS
 # ============================================================================
@@ -42,12 +119,20 @@ class PseudoCode:
     complexity: ComplexityLevel
     notes: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(frozen=True)
+class SourceFile:
+    filename: str
+    description: str
+    code: str
+    type: Optional[str] = None
+
+# Immutable: generated sources are memoized and shared between results
+@dataclass(frozen=True)
 class SourceCode:
     language: str
-    files: List[Dict[str, str]]
-    dependencies: List[str] = field(default_factory=list)
-    setup_instructions: List[str] = field(default_factory=list)
+    files: Tuple[SourceFile, ...]
+    dependencies: Tuple[str, ...] = ()
+    setup_instructions: Tuple[str, ...] = ()
 
 @dataclass
 class EffortEstimate:
@@ -55,8 +140,9 @@ class EffortEstimate:
     complexity: ComplexityLevel
     estimated_hours: float
     estimated_days: float
-    risk_factors: List[str] = field(default_factory=list)
-    assumptions: List[str] = field(default_factory=list)
+    # Usually empty: a shared empty tuple avoids two list allocations per task
+    risk_factors: Sequence[str] = ()
+    assumptions: Sequence[str] = ()
 
 @dataclass
 class TaskBreakdown:
@@ -69,6 +155,10 @@ class TaskBreakdown:
     def total_with_buffer(self) -> float:
         return self.total_days * (1 + self.buffer_percentage / 100)
 
+    @cached_property
+    def total_hours_with_buffer(self) -> float:
+        return self.total_hours * (1 + self.buffer_percentage / 100)
+
 @dataclass
 class AnalysisResult:
     issue: JiraIssue
@@ -77,7 +167,7 @@ class AnalysisResult:
     effort_estimate: TaskBreakdown
     recommendations: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(frozen=True)
 class AgentConfig:
     language: Literal["java", "angular", "fullstack", "BE", "UI"] = "java"
     backend_language: Optional[str] = None
@@ -88,140 +178,213 @@ class AgentConfig:
     source_code_field: str = "Source Code"
     original_estimate_field: str = ""
     bitbucket_provider: str = "bitbucket"
+    jira_cache_ttl: int = 300
+    verbose: bool = True
+    use_async: bool = False
+    warm_class_names: Tuple[str, ...] = ()
 
 # ============================================================================
 # JIRA CLIENT
 # ============================================================================
 
+def _dump_json(payload: Any) -> bytes:
+    """Serialize a Jira request body (Content-Type is preset on the session)"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
 class MCPJiraClient:
-    def __init__(self, provider: str = "jira"):
+    POOL_SIZE = max(8, _JIRA_UPDATE_WORKERS)
+
+    def __init__(self, provider: str = "jira", cache_ttl: int = 300, pool_size: Optional[int] = None):
         self.provider = provider
+        # A client shared by several agents needs room for all of their update threads
+        self.pool_size = max(pool_size or 0, self.POOL_SIZE)
         self.jira_base_url = os.getenv("JIRA_BASE_URL", "")
         self.jira_username = os.getenv("JIRA_USERNAME", "")
         self.jira_api_token = os.getenv("JIRA_API_TOKEN", "")
         self.use_direct_api = bool(self.jira_base_url and self.jira_username and self.jira_api_token)
-        self._field_id_cache = {}
+        self._field_id_cache: Dict[str, Optional[str]] = {}
+        self._all_fields_map: Optional[Dict[str, str]] = None
+        self._fields_lock = threading.Lock()
+        self._account_id_cache: Dict[str, Optional[str]] = {}
+        import requests_cache  # deferred: pulls in sqlite/cattrs, ~70ms at import
+        # Repeat GETs within the TTL are served from an in-memory cache private to this client.
+        # Authorization is part of the key (and not stripped as an ignored parameter), so a
+        # response fetched with one user's credentials is never replayed for another, and
+        # issue contents are never written to disk.
+        self._session = requests_cache.CachedSession(
+            "jira_cache", backend="memory", expire_after=cache_ttl,
+            allowable_methods=["GET"], allowable_codes=[200],
+            match_headers=["Authorization"], ignored_parameters=[])
+        # Basic auth is encoded once here rather than by HTTPBasicAuth on every request
+        token = base64.b64encode(f"{self.jira_username}:{self.jira_api_token}".encode()).decode()
+        self._session.headers.update({"Accept": "application/json", "Content-Type": "application/json",
+                                      "Authorization": f"Basic {token}"})
+        self._api = f"{self.jira_base_url}/rest/api/3"
+        # Keep-alive pool for the single Jira host; transient 429/5xx are retried with backoff.
+        # POST is left out so a 5xx after the comment was created cannot duplicate it.
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+                      allowed_methods=["GET", "PUT"], raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, max_retries=retry)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
         
         if self.use_direct_api:
-            print(f"🔐 Jira credentials loaded")
+            logger.info("🔐 Jira credentials loaded")
         else:
-            print(f"⚠️  Jira credentials missing")
+            logger.warning("⚠️  Jira credentials missing")
+
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request on the pooled session (auth, headers and retries preconfigured)"""
+        return self._session.request(method, url, **kwargs)
+
+    # Writes bypass the cache on their own (allowable_methods is GET-only)
+    def _post_json(self, url: str, payload: Dict[str, Any]) -> requests.Response:
+        return self._send("POST", url, data=_dump_json(payload))
+
+    def _put_json(self, url: str, payload: Dict[str, Any]) -> requests.Response:
+        return self._send("PUT", url, data=_dump_json(payload))
 
-    def get_issue_detail(self, issue_id: str, **kwargs) -> Dict[str, Any]:
+    def close(self) -> None:
+        self._session.close()
+
+    def __enter__(self) -> "MCPJiraClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def get_issue_detail(self, issue_id: str, fields: str = JIRA_ISSUE_FIELDS,
+                         include_raw: bool = False, **kwargs) -> Dict[str, Any]:
         if not self.use_direct_api:
-            return {"issue_id": issue_id, "title": "Sample Issue", "description": "Sample description", 
-                    "issue_type": "Task", "priority": "Medium", "status": "Open"}
+            return self._sample_issue_detail(issue_id)
         
         try:
-            url = f"{self.jira_base_url}/rest/api/3/issue/{issue_id}"
-            auth = HTTPBasicAuth(self.jira_username, self.jira_api_token)
-            response = requests.get(url, auth=auth, headers={"Accept": "application/json"})
+            url = f"{self._api}/issue/{issue_id}"
+            response = self._send("GET", url, params={"fields": fields})
             
             if response.status_code == 200:
-                data = response.json()
-                fields = data.get("fields", {})
-                description = self._adf_to_text(fields.get("description", ""))
-                
-                return {
-                    "issue_id": issue_id,
-                    "title": fields.get("summary", ""),
-                    "description": description or "No description",
-                    "issue_type": fields.get("issuetype", {}).get("name", "Task"),
-                    "priority": fields.get("priority", {}).get("name", "Medium"),
-                    "status": fields.get("status", {}).get("name", "Open"),
-                    "assignee": fields.get("assignee", {}).get("displayName") if fields.get("assignee") else None,
-                    "labels": fields.get("labels", []),
-                    "components": [c.get("name") for c in fields.get("components", [])],
-                    "raw_data": data
-                }
+                return self._issue_from_json(issue_id, response.json(), include_raw)
             raise ValueError(f"Failed to fetch issue: {response.status_code}")
         except Exception as e:
-            print(f"❌ Error: {e}")
+            logger.error("❌ Error: %s", e)
             raise
 
+    def batch_get_issues(self, issue_ids: List[str], max_workers: int = 8, **kwargs) -> List[Dict[str, Any]]:
+        """Fetch several issues concurrently on the pooled session, in input order"""
+        # More workers than pooled connections would just open throwaway sockets
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, self.pool_size))) as pool:
+            return list(pool.map(lambda issue_id: self.get_issue_detail(issue_id, **kwargs), issue_ids))
+
+    def _sample_issue_detail(self, issue_id: str) -> Dict[str, Any]:
+        return {"issue_id": issue_id, "title": "Sample Issue", "description": "Sample description",
+                "issue_type": "Task", "priority": "Medium", "status": "Open"}
+
+    def _issue_from_json(self, issue_id: str, data: Dict[str, Any], include_raw: bool = False) -> Dict[str, Any]:
+        fields = data.get("fields", {})
+        description = self._adf_to_text(fields.get("description", ""))
+        issue = {
+            "issue_id": issue_id,
+            "title": fields.get("summary", ""),
+            "description": description or "No description",
+            "issue_type": fields.get("issuetype", {}).get("name", "Task"),
+            "priority": fields.get("priority", {}).get("name", "Medium"),
+            "status": fields.get("status", {}).get("name", "Open"),
+            "assignee": fields.get("assignee", {}).get("displayName") if fields.get("assignee") else None,
+            "labels": fields.get("labels", []),
+            "components": [c.get("name") for c in fields.get("components", [])],
+        }
+        # Nothing downstream reads the raw payload, so keep it only on request
+        if include_raw:
+            issue["raw_data"] = data
+        return issue
+
     def parse_issue_response(self, response: Dict[str, Any]) -> JiraIssue:
-        return JiraIssue(**{k: response.get(k, v) for k, v in 
-            [("issue_id", ""), ("title", ""), ("description", ""), ("issue_type", "Task"),
-             ("priority", "Medium"), ("assignee", None), ("status", "Open"), 
-             ("labels", []), ("components", []), ("raw_data", {})]})
+        # get_issue_detail output already matches JiraIssue's fields
+        try:
+            return JiraIssue(**response)
+        except TypeError:
+            pass
+        # Shared list/dict defaults are copied so issues never alias them
+        return JiraIssue(**{k: response[k] if k in response else copy(v)
+                            for k, v in _JIRA_ISSUE_DEFAULTS.items()})
 
     def add_comment(self, issue_id: str, comment: str, **kwargs) -> bool:
         if not self.use_direct_api:
             return False
         try:
-            url = f"{self.jira_base_url}/rest/api/3/issue/{issue_id}/comment"
-            auth = HTTPBasicAuth(self.jira_username, self.jira_api_token)
+            url = f"{self._api}/issue/{issue_id}/comment"
             payload = {"body": self._markdown_to_adf(comment)}
-            response = requests.post(url, json=payload, auth=auth, 
-                headers={"Accept": "application/json", "Content-Type": "application/json"})
+            response = self._post_json(url, payload)
             return response.status_code in [200, 201]
-        except:
+        except requests.RequestException as e:
+            logger.warning("   ⚠️ Comment error: %s", e)
             return False
 
     def update_issue_field(self, issue_id: str, field_name: str, field_value: str) -> bool:
         if not self.use_direct_api:
-            print(f"   ⚠️ No Jira credentials - cannot update {field_name}")
+            logger.warning("   ⚠️ No Jira credentials - cannot update %s", field_name)
             return False
         try:
             field_id = self._get_field_id(field_name)
-            print(f"   📝 Updating '{field_name}' → {field_id}")
-            url = f"{self.jira_base_url}/rest/api/3/issue/{issue_id}"
-            auth = HTTPBasicAuth(self.jira_username, self.jira_api_token)
-            
-            if field_id == "originalEstimate":
-                payload = {"fields": {"timetracking": {"originalEstimate": f"{int(int(field_value)/3600)}h"}}}
-            elif field_id.startswith("customfield_"):
-                # Custom fields need ADF format in Jira Cloud
-                payload = {"fields": {field_id: self._text_to_adf(field_value)}}
-            else:
-                payload = {"fields": {field_id: self._markdown_to_adf(field_value)}}
-            
-            response = requests.put(url, json=payload, auth=auth,
-                headers={"Accept": "application/json", "Content-Type": "application/json"})
+            logger.info("   📝 Updating '%s' → %s", field_name, field_id)
+            url = f"{self._api}/issue/{issue_id}"
+            response = self._put_json(url, self._field_payload(field_id, field_value))
             if response.status_code == 204:
                 return True
-            print(f"   ❌ Update failed: {response.status_code} - {response.text[:200]}")
+            logger.error("   ❌ Update failed: %s - %s", response.status_code, response.text[:200])
             return False
         except Exception as e:
-            print(f"   ❌ Error: {e}")
+            logger.error("   ❌ Error: %s", e)
             return False
 
+    def _field_payload(self, field_id: str, field_value: str) -> Dict:
+        if field_id.lower() in _ORIGINAL_ESTIMATE_NAMES:
+            # Whole hours would truncate 4.5h to "4h" and 0.5h to "0h"; minutes keep the precision
+            return {"fields": {"timetracking": {"originalEstimate": f"{round(int(field_value) / 60)}m"}}}
+        if field_id.startswith("customfield_"):
+            # Custom fields need ADF format in Jira Cloud
+            return {"fields": {field_id: self._text_to_adf(field_value)}}
+        return {"fields": {field_id: self._markdown_to_adf(field_value)}}
+
     def _text_to_adf(self, text: str) -> Dict:
         """Convert plain text to ADF format for custom fields"""
-        content = []
-        for line in text.split("\n"):
-            content.append({"type": "paragraph", "content": [{"type": "text", "text": line}] if line.strip() else []})
-        return {"type": "doc", "version": 1, "content": content}
+        return {"type": "doc", "version": 1, "content": [
+            {"type": "paragraph", "content": [{"type": "text", "text": line}]} if line.strip() else _EMPTY_PARA
+            for line in text.split("\n")]}
 
-    def _create_adf_table(self, headers: List[str], rows: List[List[str]]) -> Dict:
+    def _create_adf_table(self, headers: Sequence[str], rows: Sequence[Sequence[str]]) -> Dict:
         """Create ADF table for Jira comments"""
         def cell(text, is_header=False):
             return {"type": "tableHeader" if is_header else "tableCell",
-                    "content": [{"type": "paragraph", "content": [{"type": "text", "text": str(text)}]}]}
+                    "content": [{"type": "paragraph", "content": [{"type": "text",
+                                 "text": text if type(text) is str else str(text)}]}]}
         table_rows = [{"type": "tableRow", "content": [cell(h, True) for h in headers]}]
         for row in rows:
             table_rows.append({"type": "tableRow", "content": [cell(c) for c in row]})
         return {"type": "table", "content": table_rows}
 
-    def add_comment_with_table(self, issue_id: str, title: str, headers: List[str], rows: List[List[str]]) -> bool:
+    def add_comment_with_table(self, issue_id: str, title: str, headers: Sequence[str], rows: Sequence[Sequence[str]]) -> bool:
         """Add comment with properly formatted ADF table"""
         if not self.use_direct_api:
             return False
         try:
-            url = f"{self.jira_base_url}/rest/api/3/issue/{issue_id}/comment"
-            auth = HTTPBasicAuth(self.jira_username, self.jira_api_token)
-            content = [
-                {"type": "paragraph", "content": [{"type": "text", "text": title, "marks": [{"type": "strong"}]}]},
-                self._create_adf_table(headers, rows)
-            ]
-            payload = {"body": {"type": "doc", "version": 1, "content": content}}
-            response = requests.post(url, json=payload, auth=auth,
-                headers={"Accept": "application/json", "Content-Type": "application/json"})
+            url = f"{self._api}/issue/{issue_id}/comment"
+            response = self._post_json(url, self._table_comment_payload(title, headers, rows))
             return response.status_code in [200, 201]
         except Exception as e:
-            print(f"   ❌ Comment error: {e}")
+            logger.error("   ❌ Comment error: %s", e)
             return False
 
+    def _table_comment_payload(self, title: str, headers: Sequence[str], rows: Sequence[Sequence[str]]) -> Dict:
+        content = [
+            {"type": "paragraph", "content": [{"type": "text", "text": title, "marks": _STRONG_MARKS}]},
+            self._create_adf_table(headers, rows)
+        ]
+        return {"body": {"type": "doc", "version": 1, "content": content}}
+
     def assign_issue(self, issue_id: str, assignee: str) -> bool:
         if not self.use_direct_api:
             return False
@@ -229,136 +392,232 @@ class MCPJiraClient:
             account_id = self._get_account_id(assignee)
             if not account_id:
                 return False
-            url = f"{self.jira_base_url}/rest/api/3/issue/{issue_id}/assignee"
-            auth = HTTPBasicAuth(self.jira_username, self.jira_api_token)
-            response = requests.put(url, json={"accountId": account_id}, auth=auth,
-                headers={"Accept": "application/json", "Content-Type": "application/json"})
+            url = f"{self._api}/issue/{issue_id}/assignee"
+            response = self._put_json(url, {"accountId": account_id})
             return response.status_code == 204
-        except:
+        except requests.RequestException as e:
+            logger.warning("   ⚠️ Assignment error: %s", e)
             return False
 
     def _get_account_id(self, email: str) -> Optional[str]:
+        if email in self._account_id_cache:
+            return self._account_id_cache[email]
         try:
-            url = f"{self.jira_base_url}/rest/api/3/user/search"
-            auth = HTTPBasicAuth(self.jira_username, self.jira_api_token)
-            response = requests.get(url, params={"query": email}, auth=auth, headers={"Accept": "application/json"})
+            url = f"{self._api}/user/search"
+            response = self._send("GET", url, params={"query": email})
             if response.status_code == 200:
                 users = response.json()
-                return users[0].get('accountId') if users else None
-        except:
-            pass
+                # Unknown users are cached too; failed requests are not, so they get retried
+                account_id = self._account_id_cache[email] = users[0].get('accountId') if users else None
+                return account_id
+        except (requests.RequestException, ValueError, KeyError, AttributeError) as e:
+            logger.warning("   ⚠️ User lookup failed for %s: %s", email, e)
         return None
 
     def _get_field_id(self, field_name: str) -> str:
         if field_name.startswith("customfield_"):
             return field_name
-        standard = {"description": "description", "originalEstimate": "originalEstimate", "originalestimate": "originalEstimate"}
-        if field_name.lower() in standard:
-            return standard[field_name.lower()]
+        if field_name.lower() in _ORIGINAL_ESTIMATE_NAMES:
+            return "originalEstimate"
+        if field_name.lower() == "description":
+            return "description"
         if field_name in self._field_id_cache:
-            return self._field_id_cache[field_name]
-        try:
-            url = f"{self.jira_base_url}/rest/api/3/field"
-            auth = HTTPBasicAuth(self.jira_username, self.jira_api_token)
-            response = requests.get(url, auth=auth, headers={"Accept": "application/json"})
-            if response.status_code == 200:
-                for f in response.json():
-                    if f.get("name", "").lower() == field_name.lower():
-                        self._field_id_cache[field_name] = f.get("id")
-                        return f.get("id")
-        except:
-            pass
-        return field_name
+            return self._field_id_cache[field_name] or field_name
+        all_fields = self._load_all_fields()
+        if all_fields is None:
+            return field_name
+        # Misses are cached as None too, so unknown names never trigger another fetch
+        field_id = self._field_id_cache[field_name] = all_fields.get(field_name.lower())
+        return field_id or field_name
+
+    def _load_all_fields(self) -> Optional[Dict[str, str]]:
+        """Fetch Jira's field list once and index it by lower-cased name (None if unavailable)"""
+        with self._fields_lock:
+            if self._all_fields_map is None:
+                try:
+                    response = self._send("GET", f"{self._api}/field")
+                    if response.status_code == 200:
+                        # Jira allows duplicate field names; the first match wins, as in a linear scan
+                        fields_map: Dict[str, str] = {}
+                        for f in response.json():
+                            fields_map.setdefault(f.get("name", "").lower(), f.get("id"))
+                        self._all_fields_map = fields_map
+                except (requests.RequestException, ValueError, KeyError, AttributeError) as e:
+                    logger.warning("   ⚠️ Field list unavailable: %s", e)
+            return self._all_fields_map
 
     def _adf_to_text(self, adf: Any) -> str:
         if isinstance(adf, str):
             return adf
         if not isinstance(adf, dict):
             return ""
-        parts = []
-        def extract(node):
-            if isinstance(node, dict):
-                if node.get("type") == "text":
-                    parts.append(node.get("text", ""))
-                for child in node.get("content", []):
-                    extract(child)
-            elif isinstance(node, list):
-                for item in node:
-                    extract(item)
-        extract(adf)
-        return " ".join(parts)
+        # Explicit stack instead of recursion: no frame per node, no RecursionError on deep docs
+        lines, words = [], []
+        stack = [adf]
+        while stack:
+            node = stack.pop()
+            if node is _ADF_BLOCK_END:
+                if words:
+                    lines.append("".join(words))
+                    words = []
+            elif type(node) is dict or isinstance(node, dict):
+                node_type = node.get("type")
+                # Text nodes carry their own whitespace, so they are joined as-is
+                if node_type == "text":
+                    text = node.get("text")
+                    if text:
+                        words.append(text)
+                elif node_type == "hardBreak":
+                    words.append("\n")
+                # Pushed below the children, so it pops once the block is done
+                if node_type in _ADF_BLOCK_TYPES:
+                    stack.append(_ADF_BLOCK_END)
+                children = node.get("content")
+                if children:
+                    stack.extend(reversed(children))
+            elif type(node) is list or isinstance(node, list):
+                stack.extend(reversed(node))
+        if words:
+            lines.append("".join(words))
+        return "\n".join(lines)
 
     def _markdown_to_adf(self, text: str) -> Dict:
-        paragraphs = text.split("\n\n") if "\n\n" in text else [text]
-        content = []
-        for para in paragraphs:
-            if para.strip():
-                content.append({"type": "paragraph", "content": [{"type": "text", "text": para.strip()}]})
+        # split() already yields [text] when there is no blank line, so no separate containment scan
+        content = [{"type": "paragraph", "content": [{"type": "text", "text": p}]}
+                   for p in (para.strip() for para in text.split("\n\n")) if p]
         return {"type": "doc", "version": 1, "content": content}
 
-# ============================================================================
-# CODE GENERATORS
-# ============================================================================
+class AsyncMCPJiraClient:
+    """aiohttp-backed Jira writer for bulk update flows; use as ``async with``
 
-class PseudoCodeGenerator:
-    def __init__(self, language: str):
-        self.language = language
+    Wraps a sync MCPJiraClient rather than subclassing it, so it can never be handed
+    to code expecting the sync API. The wrapped client supplies credentials, payload
+    builders and the cached field/account lookups, and stays open after exit.
+    """
 
-    def generate(self, issue: JiraIssue) -> PseudoCode:
-        complexity = self._analyze_complexity(issue)
-        steps = self._generate_steps(issue)
-        return PseudoCode(
-            sections=[{"title": "Implementation Algorithm", "steps": steps}],
-            complexity=complexity,
-            notes=[f"Target: {self.language.upper()}", f"Complexity: {complexity.value}"]
-        )
+    CONNECTION_LIMIT = 50
 
-    def _analyze_complexity(self, issue: JiraIssue) -> ComplexityLevel:
-        desc_len = len(issue.description)
-        issue_type = issue.issue_type.lower()
-        if issue_type in ["bug", "task"] and desc_len < 200:
-            return ComplexityLevel.SIMPLE
-        elif issue_type in ["feature", "story"] or desc_len > 500:
-            return ComplexityLevel.COMPLEX
-        return ComplexityLevel.MODERATE
+    def __init__(self, jira_client: MCPJiraClient):
+        self._jira = jira_client
+        self._aio = None
 
-    def _generate_steps(self, issue: JiraIssue) -> str:
-        desc = issue.description.lower()
-        has_api = any(w in desc for w in ['api', 'endpoint', 'service', 'rest'])
-        has_db = any(w in desc for w in ['database', 'repository', 'store', 'query'])
-        has_validation = any(w in desc for w in ['validate', 'check', 'verify'])
-        
-        steps = ["BEGIN"]
-        if has_validation:
-            steps.extend(["  // Input Validation", "  VALIDATE request parameters", "  IF invalid THEN THROW ValidationException", ""])
-        steps.extend([f"  // Main Logic: {issue.title}", "  PROCESS request data", "  APPLY business rules"])
-        if has_db:
-            steps.append("  EXECUTE database operation")
-        if has_api:
-            steps.append("  CALL external API if needed")
-        steps.extend(["", "  // Response", "  CREATE response", "  RETURN result", "END"])
-        return "\n".join(steps)
+    @property
+    def use_direct_api(self) -> bool:
+        return self._jira.use_direct_api
 
+    async def __aenter__(self) -> "AsyncMCPJiraClient":
+        import aiohttp
+        self._aio = aiohttp.ClientSession(
+            headers=dict(self._jira._session.headers),
+            connector=aiohttp.TCPConnector(limit=self.CONNECTION_LIMIT, keepalive_timeout=30))
+        return self
 
-class SourceCodeGenerator:
-    def __init__(self, language: str):
-        self.language = language
+    async def __aexit__(self, *exc) -> None:
+        if self._aio is not None:
+            await self._aio.close()
+            self._aio = None
 
-    def generate(self, issue: JiraIssue, pseudo_code: PseudoCode) -> SourceCode:
-        class_name = self._to_class_name(issue.title)
-        if self.language == "java":
-            return self._java_code(class_name)
-        return self._angular_code(class_name)
+    async def _send_json(self, method: str, url: str, payload: Dict[str, Any]) -> int:
+        async with self._aio.request(method, url, data=_dump_json(payload)) as resp:
+            return resp.status
 
-    def _to_class_name(self, title: str) -> str:
-        skip = {'a','an','the','is','are','to','of','for','with','write','create','update','delete','new','this','that'}
-        words = [w.capitalize() for w in re.sub(r'[^a-zA-Z0-9\s]', '', title).split() 
-                 if w.lower() not in skip and len(w) > 2][:3]
-        return "".join(words) or "Default"
+    async def get_issue_detail(self, issue_id: str, fields: str = JIRA_ISSUE_FIELDS,
+                               include_raw: bool = False, **kwargs) -> Dict[str, Any]:
+        if not self.use_direct_api:
+            return self._jira._sample_issue_detail(issue_id)
+        url = f"{self._jira._api}/issue/{issue_id}"
+        async with self._aio.get(url, params={"fields": fields}) as resp:
+            if resp.status != 200:
+                raise ValueError(f"Failed to fetch issue: {resp.status}")
+            return self._jira._issue_from_json(issue_id, await resp.json(), include_raw)
 
-    def _java_code(self, name: str) -> SourceCode:
-        ctrl = f'''@RestController
-@RequestMapping("/api/{name.lower()}")
+    async def batch_get_issues(self, issue_ids: List[str], **kwargs) -> List[Dict[str, Any]]:
+        return list(await asyncio.gather(*(self.get_issue_detail(i, **kwargs) for i in issue_ids)))
+
+    async def add_comment(self, issue_id: str, comment: str, **kwargs) -> bool:
+        if not self.use_direct_api:
+            return False
+        try:
+            url = f"{self._jira._api}/issue/{issue_id}/comment"
+            return await self._send_json("POST", url, {"body": self._jira._markdown_to_adf(comment)}) in [200, 201]
+        except Exception as e:
+            logger.warning("   ⚠️ Comment error: %s", e)
+            return False
+
+    async def update_issue_field(self, issue_id: str, field_name: str, field_value: str) -> bool:
+        if not self.use_direct_api:
+            logger.warning("   ⚠️ No Jira credentials - cannot update %s", field_name)
+            return False
+        try:
+            # Field lookup is cached after the first call, so the thread hop is cheap
+            field_id = await asyncio.to_thread(self._jira._get_field_id, field_name)
+            url = f"{self._jira._api}/issue/{issue_id}"
+            status = await self._send_json("PUT", url, self._jira._field_payload(field_id, field_value))
+            if status == 204:
+                return True
+            logger.error("   ❌ Update failed: %s", status)
+            return False
+        except Exception as e:
+            logger.error("   ❌ Error: %s", e)
+            return False
+
+    async def add_comment_with_table(self, issue_id: str, title: str, headers: Sequence[str], rows: Sequence[Sequence[str]]) -> bool:
+        if not self.use_direct_api:
+            return False
+        try:
+            url = f"{self._jira._api}/issue/{issue_id}/comment"
+            payload = self._jira._table_comment_payload(title, headers, rows)
+            return await self._send_json("POST", url, payload) in [200, 201]
+        except Exception as e:
+            logger.error("   ❌ Comment error: %s", e)
+            return False
+
+    async def assign_issue(self, issue_id: str, assignee: str) -> bool:
+        if not self.use_direct_api:
+            return False
+        try:
+            account_id = await asyncio.to_thread(self._jira._get_account_id, assignee)
+            if not account_id:
+                return False
+            url = f"{self._jira._api}/issue/{issue_id}/assignee"
+            return await self._send_json("PUT", url, {"accountId": account_id}) == 204
+        except Exception as e:
+            logger.warning("   ⚠️ Assignment error: %s", e)
+            return False
+
+# ============================================================================
+# CODE GENERATORS
+# ============================================================================
+
+_NON_ALNUM_RE = re.compile(r'[^a-zA-Z0-9\s]')
+_CAMEL_RE = re.compile(r'([a-z])([A-Z])')
+_SKIP_WORDS = frozenset({'a','an','the','is','are','to','of','for','with','write','create','update','delete','new','this','that'})
+# Step keywords -> category; matched as substrings like the original `w in desc` checks
+_STEP_KEYWORDS = {
+    **dict.fromkeys(('api', 'endpoint', 'service', 'rest'), 'api'),
+    **dict.fromkeys(('database', 'repository', 'store', 'query'), 'db'),
+    **dict.fromkeys(('validate', 'check', 'verify'), 'validation'),
+}
+# Pseudo-code step blocks, assembled by _generate_steps
+_STEPS_VALIDATION = "  // Input Validation\n  VALIDATE request parameters\n  IF invalid THEN THROW ValidationException\n"
+_STEPS_MAIN = "  // Main Logic: {title}\n  PROCESS request data\n  APPLY business rules"
+_STEPS_DB = "  EXECUTE database operation"
+_STEPS_API = "  CALL external API if needed"
+_STEPS_RESPONSE = "\n  // Response\n  CREATE response\n  RETURN result\nEND"
+# Complexity by issue type, indexed by description bucket (<200, 200-500, >500 chars)
+_COMPLEXITY_BY_LENGTH = (ComplexityLevel.MODERATE, ComplexityLevel.MODERATE, ComplexityLevel.COMPLEX)
+_COMPLEXITY_BY_TYPE = {
+    "bug": (ComplexityLevel.SIMPLE, ComplexityLevel.MODERATE, ComplexityLevel.COMPLEX),
+    "task": (ComplexityLevel.SIMPLE, ComplexityLevel.MODERATE, ComplexityLevel.COMPLEX),
+    "feature": (ComplexityLevel.COMPLEX,) * 3,
+    "story": (ComplexityLevel.COMPLEX,) * 3,
+}
+# Zero-width lookahead so overlapping hits ("restore" -> rest + store) are all seen
+_STEP_KEYWORD_RE = re.compile(f"(?=({'|'.join(_STEP_KEYWORDS)}))")
+
+# Code templates, filled with str.format; literal braces are doubled
+_JAVA_CONTROLLER_TPL = '''@RestController
+@RequestMapping("/api/{name_lower}")
 @RequiredArgsConstructor
 public class {name}Controller {{
     private final {name}Service service;
@@ -373,7 +632,8 @@ public class {name}Controller {{
         return ResponseEntity.ok(service.findById(id));
     }}
 }}'''
-        svc = f'''@Service
+
+_JAVA_SERVICE_TPL = '''@Service
 @RequiredArgsConstructor
 public class {name}Service {{
     private final {name}Repository repository;
@@ -391,15 +651,8 @@ public class {name}Service {{
             .orElseThrow(() -> new NotFoundException("Not found: " + id));
     }}
 }}'''
-        return SourceCode("java", [
-            {"filename": f"{name}Controller.java", "code": ctrl, "description": "REST Controller"},
-            {"filename": f"{name}Service.java", "code": svc, "description": "Service Layer"}
-        ], ["spring-boot-starter-web", "spring-boot-starter-data-jpa", "lombok"],
-           ["Add dependencies to pom.xml", "Configure application.properties", "Run: mvn spring-boot:run"])
 
-    def _angular_code(self, name: str) -> SourceCode:
-        kebab = re.sub(r'([a-z])([A-Z])', r'\1-\2', name).lower()
-        comp = f'''@Component({{
+_ANGULAR_COMPONENT_TPL = '''@Component({{
   selector: 'app-{kebab}',
   templateUrl: './{kebab}.component.html'
 }})
@@ -419,7 +672,8 @@ export class {name}Component implements OnInit {{
     }});
   }}
 }}'''
-        svc = f'''@Injectable({{ providedIn: 'root' }})
+
+_ANGULAR_SERVICE_TPL = '''@Injectable({{ providedIn: 'root' }})
 export class {name}Service {{
   private apiUrl = '/api/{kebab}';
   
@@ -437,11 +691,145 @@ export class {name}Service {{
     return throwError(() => error);
   }}
 }}'''
-        return SourceCode("angular", [
-            {"filename": f"{kebab}.component.ts", "code": comp, "description": "Component"},
-            {"filename": f"{kebab}.service.ts", "code": svc, "description": "Service"}
-        ], ["@angular/core", "@angular/common", "rxjs"],
-           ["Run: npm install", "Import in module", "Run: ng serve"])
+
+class PseudoCodeGenerator:
+    def __init__(self, language: str):
+        self.language = language
+        # Notes depend only on (language, complexity): build all three once
+        self._notes = {c: (f"Target: {language.upper()}", f"Complexity: {c.value}") for c in ComplexityLevel}
+
+    def generate(self, issue: JiraIssue) -> PseudoCode:
+        # Deterministic in these fields, so re-analyzing an issue reuses the result.
+        # The cached value is shared, so callers get their own section dicts and lists.
+        cached = _pseudo_code(self.language, issue.issue_type, issue.title, issue.description)
+        return PseudoCode([dict(s) for s in cached.sections], cached.complexity, list(cached.notes))
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop memoized pseudo code (for long-running services)"""
+        _pseudo_code.cache_clear()
+
+    def _generate(self, issue: JiraIssue) -> PseudoCode:
+        complexity = self._analyze_complexity(issue)
+        steps = self._generate_steps(issue)
+        return PseudoCode(
+            sections=[{"title": "Implementation Algorithm", "steps": steps}],
+            complexity=complexity,
+            notes=list(self._notes[complexity])
+        )
+
+    def _analyze_complexity(self, issue: JiraIssue) -> ComplexityLevel:
+        desc_len = len(issue.description)
+        bucket = (desc_len >= 200) + (desc_len > 500)
+        return _COMPLEXITY_BY_TYPE.get(issue.issue_type.lower(), _COMPLEXITY_BY_LENGTH)[bucket]
+
+    def _generate_steps(self, issue: JiraIssue) -> str:
+        # One scan of the description instead of one per keyword
+        found = set()
+        for match in _STEP_KEYWORD_RE.finditer(issue.description.lower()):
+            found.add(_STEP_KEYWORDS[match.group(1)])
+            if len(found) == 3:
+                break
+        has_api, has_db, has_validation = 'api' in found, 'db' in found, 'validation' in found
+        
+        parts = ["BEGIN"]
+        if has_validation:
+            parts.append(_STEPS_VALIDATION)
+        parts.append(_STEPS_MAIN.format(title=issue.title))
+        if has_db:
+            parts.append(_STEPS_DB)
+        if has_api:
+            parts.append(_STEPS_API)
+        parts.append(_STEPS_RESPONSE)
+        return "\n".join(parts)
+
+
+@lru_cache(maxsize=512)
+def _pseudo_code(language: str, issue_type: str, title: str, description: str) -> PseudoCode:
+    # Keyed on the language, not a generator instance, so ad-hoc generators share entries.
+    # Generation reads only these fields; the rest of the issue is left blank.
+    return _get_pseudo_gen(language)._generate(JiraIssue("", title, description, issue_type, ""))
+
+
+class SourceCodeGenerator:
+    def __init__(self, language: str):
+        self.language = language
+
+    def generate(self, issue: JiraIssue, pseudo_code: PseudoCode) -> SourceCode:
+        class_name = self._to_class_name(issue.title)
+        if self.language == "java":
+            return self._java_code(class_name)
+        return self._angular_code(class_name)
+
+    def _to_class_name(self, title: str) -> str:
+        return _class_name(title)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop memoized class names and generated sources (for long-running services)"""
+        _class_name.cache_clear()
+        _java_source.cache_clear()
+        _angular_source.cache_clear()
+
+    @classmethod
+    def warm_cache(cls, class_names: Iterable[str]) -> None:
+        """Pre-render sources for known class names so the first issues hit the cache"""
+        for name in class_names:
+            _java_source(name)
+            _angular_source(name)
+
+    def _java_code(self, name: str) -> SourceCode:
+        return _java_source(name)
+
+    def _angular_code(self, name: str) -> SourceCode:
+        return _angular_source(name)
+
+@lru_cache(maxsize=1024)
+def _class_name(title: str) -> str:
+    # islice stops after three kept words, so the rest are never lowered/capitalized
+    words = islice((w.capitalize() for w in _NON_ALNUM_RE.sub('', title).split()
+                    if len(w) > 2 and w.lower() not in _SKIP_WORDS), 3)
+    return "".join(words) or "Default"
+
+
+# Static per language; tuples so every SourceCode can share them
+_JAVA_DEPS = ("spring-boot-starter-web", "spring-boot-starter-data-jpa", "lombok")
+_JAVA_SETUP = ("Add dependencies to pom.xml", "Configure application.properties", "Run: mvn spring-boot:run")
+_ANGULAR_DEPS = ("@angular/core", "@angular/common", "rxjs")
+_ANGULAR_SETUP = ("Run: npm install", "Import in module", "Run: ng serve")
+
+
+# Output depends only on the class name and SourceCode is frozen, so issues that
+# collapse to the same name (e.g. "Default") can safely share one instance
+@lru_cache(maxsize=128)
+def _java_source(name: str) -> SourceCode:
+    ctrl = _JAVA_CONTROLLER_TPL.format(name=name, name_lower=name.lower())
+    svc = _JAVA_SERVICE_TPL.format(name=name)
+    return SourceCode("java", (
+        SourceFile(f"{name}Controller.java", "REST Controller", ctrl, "backend"),
+        SourceFile(f"{name}Service.java", "Service Layer", svc, "backend")
+    ), _JAVA_DEPS, _JAVA_SETUP)
+
+
+@lru_cache(maxsize=128)
+def _angular_source(name: str) -> SourceCode:
+    kebab = _CAMEL_RE.sub(r'\1-\2', name).lower()
+    comp = _ANGULAR_COMPONENT_TPL.format(name=name, kebab=kebab)
+    svc = _ANGULAR_SERVICE_TPL.format(name=name, kebab=kebab)
+    return SourceCode("angular", (
+        SourceFile(f"{kebab}.component.ts", "Component", comp, "frontend"),
+        SourceFile(f"{kebab}.service.ts", "Service", svc, "frontend")
+    ), _ANGULAR_DEPS, _ANGULAR_SETUP)
+
+# Generators hold no per-call state, so one instance per language is shared
+@lru_cache(maxsize=8)
+def _get_pseudo_gen(language: str) -> PseudoCodeGenerator:
+    return PseudoCodeGenerator(language)
+
+
+@lru_cache(maxsize=8)
+def _get_source_gen(language: str) -> SourceCodeGenerator:
+    return SourceCodeGenerator(language)
 
 # ============================================================================
 # EFFORT ESTIMATOR
@@ -457,22 +845,31 @@ class EffortEstimator:
     def __init__(self, max_hours: float = 4.0, hours_per_day: float = 8.0):
         self.max_hours = max_hours
         self.hours_per_day = hours_per_day
+        # Only three complexities and a fixed cap, so the arithmetic is done once here
+        self._per_complexity = {c: self._scaled_hours(base) for c, base in self.BASE_HOURS.items()}
 
-    def estimate(self, issue: JiraIssue, pseudo_code: PseudoCode, language: str) -> TaskBreakdown:
-        base = self.BASE_HOURS[pseudo_code.complexity]
-        tasks = [
-            EffortEstimate(f"Design - {issue.title[:30]}", pseudo_code.complexity, base["design"], base["design"]/self.hours_per_day),
-            EffortEstimate(f"Implementation ({language})", pseudo_code.complexity, base["implementation"], base["implementation"]/self.hours_per_day),
-            EffortEstimate("Testing", pseudo_code.complexity, base["testing"], base["testing"]/self.hours_per_day),
-            EffortEstimate("Code Review", pseudo_code.complexity, base["review"], base["review"]/self.hours_per_day)
-        ]
-        total_hours = sum(t.estimated_hours for t in tasks)
+    def _scaled_hours(self, base: Dict[str, float]) -> Tuple[List[Tuple[float, float]], float, float]:
+        """(hours, days) per task plus rounded totals, scaled down to max_hours if needed"""
+        hours = [base["design"], base["implementation"], base["testing"], base["review"]]
+        total_hours = sum(hours)
         if total_hours > self.max_hours:
             scale = self.max_hours / total_hours
-            tasks = [EffortEstimate(t.task_name, t.complexity, round(t.estimated_hours*scale, 2), 
-                     round(t.estimated_hours*scale/self.hours_per_day, 2)) for t in tasks]
+            per_task = [(round(h*scale, 2), round(h*scale/self.hours_per_day, 2)) for h in hours]
             total_hours = self.max_hours
-        return TaskBreakdown(tasks, round(total_hours, 2), round(total_hours/self.hours_per_day, 2))
+        else:
+            per_task = [(h, h/self.hours_per_day) for h in hours]
+        return per_task, round(total_hours, 2), round(total_hours/self.hours_per_day, 2)
+
+    def estimate(self, issue: JiraIssue, pseudo_code: PseudoCode, language: str) -> TaskBreakdown:
+        complexity = pseudo_code.complexity
+        per_task, total_hours, total_days = self._per_complexity[complexity]
+        names = (f"Design - {issue.title[:30]}", f"Implementation ({language})", "Testing", "Code Review")
+        tasks = [EffortEstimate(name, complexity, h, d) for name, (h, d) in zip(names, per_task)]
+        return TaskBreakdown(tasks, total_hours, total_days)
+
+@lru_cache(maxsize=16)
+def _estimator(max_hours: float) -> EffortEstimator:
+    return EffortEstimator(max_hours)
 
 # ============================================================================
 # FORMATTER
@@ -480,51 +877,113 @@ class EffortEstimator:
 
 class MarkdownFormatter:
     def format(self, result: AnalysisResult) -> str:
+        buf = io.StringIO()
+        self.format_to_stream(result, buf)
+        return buf.getvalue()
+
+    def format_to_stream(self, result: AnalysisResult, writer: TextIO) -> None:
+        """Write the report piece by piece so large reports are never held as one string"""
         issue = result.issue
         pseudo = result.pseudo_code
         source = result.source_code
         effort = result.effort_estimate
-        
-        sections = [
-            f"# {issue.issue_id}: {issue.title}\n\n---",
-            f"## Issue Details\n| Field | Value |\n|-------|-------|\n| Type | {issue.issue_type} |\n| Priority | {issue.priority} |\n| Status | {issue.status} |\n\n### Description\n{issue.description}",
-            f"## Pseudo Code\n**Complexity:** `{pseudo.complexity.value}`\n\n```\n{pseudo.sections[0]['steps']}\n```",
-            f"## Source Code ({source.language.upper()})\n" + "\n\n".join([f"### {f['filename']}\n```\n{f['code']}\n```" for f in source.files]),
-            "## Effort Estimation\n| Task | Hours | Days |\n|------|-------|------|\n" + "\n".join([f"| {t.task_name} | {t.estimated_hours} | {t.estimated_days:.2f} |" for t in effort.tasks]) + f"\n| **Total** | **{effort.total_hours}** | **{effort.total_days:.2f}** |\n| **With Buffer** | **{effort.total_hours*1.2:.2f}** | **{effort.total_with_buffer:.2f}** |",
-            f"---\n_Generated on {datetime.now().strftime('%Y-%m-%d %H:%M')}_"
-        ]
-        return "\n\n".join(sections)
+        write = writer.write
+
+        write(f"# {issue.issue_id}: {issue.title}\n\n---\n\n")
+        write(f"## Issue Details\n| Field | Value |\n|-------|-------|\n| Type | {issue.issue_type} |\n| Priority | {issue.priority} |\n| Status | {issue.status} |\n\n### Description\n{issue.description}\n\n")
+        write(f"## Pseudo Code\n**Complexity:** `{pseudo.complexity.value}`\n\n" + "\n\n".join([f"### {s['title']}\n```\n{s['steps']}\n```" for s in pseudo.sections]) + "\n\n")
+        write(f"## Source Code ({source.language.upper()})\n")
+        code_tag = _CODE_TAGS.get(source.language)
+        for i, f in enumerate(source.files):
+            if i:
+                write("\n\n")
+            write(f"### {f.filename}\n```{code_tag or _CODE_TAGS.get(f.type, '')}\n{f.code}\n```")
+        write("\n\n## Effort Estimation\n| Task | Hours | Days |\n|------|-------|------|\n" + "\n".join([f"| {t.task_name} | {t.estimated_hours} | {t.estimated_days:.2f} |" for t in effort.tasks]) + f"\n| **Total** | **{effort.total_hours}** | **{effort.total_days:.2f}** |\n| **With Buffer** | **{effort.total_hours_with_buffer:.2f}** | **{effort.total_with_buffer:.2f}** |\n\n")
+        write(f"---\n_Generated on {datetime.now().strftime('%Y-%m-%d %H:%M')}_")
+
+@lru_cache(maxsize=1)
+def _formatter() -> MarkdownFormatter:
+    return MarkdownFormatter()
 
 # ============================================================================
 # MAIN AGENT
 # ============================================================================
 
+@dataclass
+class _JiraUpdate:
+    label: str
+    method: str
+    args: tuple
+    success_msg: str
+    failure_msg: str
+
+def _log_update(update: _JiraUpdate, ok: bool) -> None:
+    if ok:
+        logger.info(update.success_msg)
+    else:
+        logger.warning(update.failure_msg)
+
+
 class JiraAnalysisAgent:
-    def __init__(self, config: AgentConfig):
+    def __init__(self, config: AgentConfig, jira_client: Optional[MCPJiraClient] = None):
         self.config = config
-        lang = {"BE": "java", "UI": "angular"}.get(config.language, config.language)
+        if jira_client is not None:
+            # Share a caller-owned client (session, pool, field map); cached_property yields to it
+            self.jira_client = jira_client
+        lang = _LANG_ALIAS.get(config.language, config.language)
         self.is_fullstack = lang == "fullstack"
         self.backend_lang = config.backend_language or "java" if self.is_fullstack or lang == "java" else None
         self.frontend_lang = config.frontend_language or "angular" if self.is_fullstack or lang == "angular" else None
         
-        self.jira_client = MCPJiraClient(config.jira_provider)
-        self.effort_estimator = EffortEstimator(config.max_hours)
-        self.formatter = MarkdownFormatter()
+        self.effort_estimator = _estimator(config.max_hours)
+        self.formatter = _formatter()
+        if config.warm_class_names:
+            SourceCodeGenerator.warm_cache(config.warm_class_names)
+
+    @cached_property
+    def jira_client(self) -> MCPJiraClient:
+        # Built on first Jira call so report-only agents skip the cache/session setup
+        return MCPJiraClient(self.config.jira_provider, self.config.jira_cache_ttl)
+
+    def _progress(self, message: str, *args: Any) -> None:
+        # Arguments are only formatted if the record is actually emitted
+        if self.config.verbose:
+            logger.info(message, *args)
 
     def analyze_issue(self, issue_id: str, **kwargs) -> AnalysisResult:
-        print(f"📥 Fetching: {issue_id}")
+        self._progress("📥 Fetching: %s", issue_id)
         issue = self.jira_client.parse_issue_response(self.jira_client.get_issue_detail(issue_id, **kwargs))
-        print(f"✅ {issue.title}")
+        self._progress("✅ %s", issue.title)
 
-        lang = self.backend_lang or self.frontend_lang or "java"
-        print(f"🔍 Generating pseudo code ({lang})")
-        pseudo = PseudoCodeGenerator(lang).generate(issue)
-        
-        print(f"💻 Generating source code")
-        source = SourceCodeGenerator(lang).generate(issue, pseudo)
-        
-        print(f"📊 Estimating effort")
-        effort = self.effort_estimator.estimate(issue, pseudo, lang)
+        if self.is_fullstack:
+            lang = "fullstack"
+            self._progress("🔍 Generating pseudo code (%s + %s)", self.backend_lang, self.frontend_lang)
+            be_pseudo = _get_pseudo_gen(self.backend_lang).generate(issue)
+            fe_pseudo = _get_pseudo_gen(self.frontend_lang).generate(issue)
+            pseudo = PseudoCode(
+                sections=[{"title": "Backend Algorithm", "steps": be_pseudo.sections[0]["steps"]},
+                          {"title": "Frontend Algorithm", "steps": fe_pseudo.sections[0]["steps"]}],
+                complexity=be_pseudo.complexity,
+                notes=be_pseudo.notes + fe_pseudo.notes[:1]
+            )
+
+            self._progress("💻 Generating source code + 📊 estimating effort")
+            be_source = _get_source_gen(self.backend_lang).generate(issue, be_pseudo)
+            fe_source = _get_source_gen(self.frontend_lang).generate(issue, fe_pseudo)
+            effort = self.effort_estimator.estimate(issue, pseudo, lang)
+            source = SourceCode("fullstack",
+                be_source.files + fe_source.files,
+                be_source.dependencies + fe_source.dependencies,
+                be_source.setup_instructions + fe_source.setup_instructions)
+        else:
+            lang = self.backend_lang or self.frontend_lang or "java"
+            self._progress("🔍 Generating pseudo code (%s)", lang)
+            pseudo = _get_pseudo_gen(lang).generate(issue)
+
+            # Both are cached in-memory work; pool dispatch would cost more than the calls
+            self._progress("💻 Generating source code + 📊 estimating effort")
+            source = _get_source_gen(lang).generate(issue, pseudo)
+            effort = self.effort_estimator.estimate(issue, pseudo, lang)
         
         recommendations = []
         if pseudo.complexity == ComplexityLevel.COMPLEX:
@@ -534,56 +993,131 @@ class JiraAnalysisAgent:
         
         return AnalysisResult(issue, pseudo, source, effort, recommendations)
 
+    def analyze_issues(self, issue_ids: List[str], workers: int = 5) -> List[AnalysisResult]:
+        """Analyze several issues concurrently; each is dominated by its blocking Jira fetch"""
+        _ = self.jira_client  # build the shared client once, before the workers race for it
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(self.analyze_issue, issue_ids))
+
     def generate_report(self, result: AnalysisResult, **kwargs) -> str:
         return self.formatter.format(result)
 
+    def write_report(self, result: AnalysisResult, writer: TextIO) -> None:
+        self.formatter.format_to_stream(result, writer)
+
+    def _format_source_for_jira(self, source: SourceCode) -> str:
+        file_blocks = [_JIRA_FILE_TEMPLATE.format(filename=f.filename, code=f.code) for f in source.files]
+        return f"💻 Source Code ({source.language.upper()})\n\n" + "".join(file_blocks)
+
+    def _format_effort_for_jira(self, effort: TaskBreakdown) -> List[Tuple[str, str, str]]:
+        return [
+            *((t.task_name, f"{t.estimated_hours}", f"{t.estimated_days:.2f}") for t in effort.tasks),
+            ("TOTAL", f"{effort.total_hours}", f"{effort.total_days:.2f}"),
+            (f"With Buffer ({int(effort.buffer_percentage)}%)",
+             f"{effort.total_hours_with_buffer:.2f}", f"{effort.total_with_buffer:.2f}")
+        ]
+
+    def _jira_updates(self, result: AnalysisResult, assign_to: Optional[str]) -> List[_JiraUpdate]:
+        """Independent Jira writes for a result, shared by the sync and async paths"""
+        issue_id = result.issue.issue_id
+        effort = result.effort_estimate
+        field = "update_issue_field"
+
+        # 1. Pseudo Code field
+        pseudo_text = f"🔍 Pseudo Code ({result.pseudo_code.complexity.value})\n\n" + "\n\n".join(
+            [f"// {s['title']}\n{s['steps']}" for s in result.pseudo_code.sections])
+        updates = [_JiraUpdate("pseudo_code", field, (issue_id, self.config.pseudo_code_field, pseudo_text),
+                               "✅ Pseudo Code updated", "⚠️ Pseudo Code update failed")]
+        # 2. Source Code field
+        if self.config.source_code_field:
+            source_text = self._format_source_for_jira(result.source_code)
+            updates.append(_JiraUpdate("source_code", field, (issue_id, self.config.source_code_field, source_text),
+                                       "✅ Source Code updated", "⚠️ Source Code update failed"))
+        # 3. Original Estimate field (Jira expects seconds)
+        if self.config.original_estimate_field:
+            seconds = str(int(effort.total_hours * 3600))
+            updates.append(_JiraUpdate("original_estimate", field,
+                                       (issue_id, self.config.original_estimate_field, seconds),
+                                       "✅ Original Estimate updated", "⚠️ Original Estimate update failed"))
+        # 4. Effort estimation as ADF table comment
+        rows = self._format_effort_for_jira(effort)
+        updates.append(_JiraUpdate("effort_comment", "add_comment_with_table",
+                                   (issue_id, "📊 Effort Estimation", ["Task", "Hours", "Days"], rows),
+                                   "✅ Effort table added", "⚠️ Effort comment failed"))
+        # 5. Assignment
+        if assign_to:
+            updates.append(_JiraUpdate("assign", "assign_issue", (issue_id, assign_to),
+                                       f"✅ Assigned to {assign_to}", f"⚠️ Assignment to {assign_to} failed"))
+        return updates
+
+    def _finish_jira_update(self, issue_id: str, results: Dict[str, bool]) -> bool:
+        if all(results.values()):
+            logger.info("✅ Jira updated: %s", issue_id)
+            return True
+        logger.warning("⚠️ Jira partially updated: %s", issue_id)
+        return False
+
     def update_jira_with_analysis(self, result: AnalysisResult, assign_to: Optional[str] = None, **kwargs) -> bool:
+        if self.config.use_async:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return asyncio.run(self.update_jira_with_analysis_async(result, assign_to))
+            raise RuntimeError("use_async inside a running event loop: "
+                               "await update_jira_with_analysis_async instead")
+
+        updates = self._jira_updates(result, assign_to)
+
+        def run(update: _JiraUpdate) -> bool:
+            ok = getattr(self.jira_client, update.method)(*update.args)
+            _log_update(update, ok)
+            return ok
+
+        # The writes are independent, so pay one round trip instead of the sum
+        logger.info("📝 Updating Jira: %s...", ", ".join(u.label for u in updates))
         try:
-            # 1. Update Pseudo Code field
-            print(f"📝 Updating Pseudo Code field...")
-            pseudo_text = f"🔍 Pseudo Code ({result.pseudo_code.complexity.value})\n\n{result.pseudo_code.sections[0]['steps']}"
-            if self.jira_client.update_issue_field(result.issue.issue_id, self.config.pseudo_code_field, pseudo_text):
-                print(f"✅ Pseudo Code updated")
-            else:
-                print(f"⚠️ Pseudo Code update failed")
-            
-            # 2. Update Source Code field
-            if self.config.source_code_field:
-                print(f"📝 Updating Source Code field...")
-                source_text = f"💻 Source Code ({result.source_code.language.upper()})\n\n"
-                for f in result.source_code.files:
-                    source_text += f"// === {f['filename']} ===\n{f['code']}\n\n"
-                if self.jira_client.update_issue_field(result.issue.issue_id, self.config.source_code_field, source_text):
-                    print(f"✅ Source Code updated")
-                else:
-                    print(f"⚠️ Source Code update failed")
-            
-            # 3. Add effort estimation as ADF table comment
-            print(f"📊 Adding effort estimation comment...")
-            headers = ["Task", "Hours", "Days"]
-            rows = [[t.task_name, str(t.estimated_hours), f"{t.estimated_days:.2f}"] for t in result.effort_estimate.tasks]
-            rows.append(["TOTAL", str(result.effort_estimate.total_hours), f"{result.effort_estimate.total_days:.2f}"])
-            rows.append([f"With Buffer ({int(result.effort_estimate.buffer_percentage)}%)",
-                        f"{result.effort_estimate.total_hours * 1.2:.2f}",
-                        f"{result.effort_estimate.total_with_buffer:.2f}"])
-            if self.jira_client.add_comment_with_table(result.issue.issue_id, "📊 Effort Estimation", headers, rows):
-                print(f"✅ Effort table added")
-            else:
-                print(f"⚠️ Effort comment failed")
-            
-            # 4. Assign if requested
-            if assign_to:
-                if self.jira_client.assign_issue(result.issue.issue_id, assign_to):
-                    print(f"✅ Assigned to {assign_to}")
-            
-            print(f"✅ Jira updated: {result.issue.issue_id}")
-            return True
+            with ThreadPoolExecutor(max_workers=_JIRA_UPDATE_WORKERS) as pool:
+                futures = {pool.submit(run, update): update.label for update in updates}
+                results = {futures[future]: future.result() for future in as_completed(futures)}
+        except Exception as e:
+            logger.error("❌ Failed: %s", e)
+            return False
+        return self._finish_jira_update(result.issue.issue_id, results)
+
+    async def update_jira_with_analysis_async(self, result: AnalysisResult, assign_to: Optional[str] = None,
+                                              client: Optional[AsyncMCPJiraClient] = None) -> bool:
+        """Same writes as update_jira_with_analysis, gathered on one aiohttp session
+
+        Pass a long-lived ``client`` to reuse its connections across calls; without one,
+        a session is opened just for this issue.
+        """
+        if client is None:
+            async with AsyncMCPJiraClient(self.jira_client) as client:
+                return await self.update_jira_with_analysis_async(result, assign_to, client)
+
+        updates = self._jira_updates(result, assign_to)
+        logger.info("📝 Updating Jira: %s...", ", ".join(u.label for u in updates))
+        try:
+            oks = await asyncio.gather(*(getattr(client, u.method)(*u.args) for u in updates))
         except Exception as e:
-            print(f"❌ Failed: {e}")
+            logger.error("❌ Failed: %s", e)
             return False
+        for update, ok in zip(updates, oks):
+            _log_update(update, ok)
+        return self._finish_jira_update(result.issue.issue_id, dict(zip((u.label for u in updates), oks)))
 
+    async def update_jira_many_async(self, results: Sequence[AnalysisResult], assign_to: Optional[str] = None,
+                                     client: Optional[AsyncMCPJiraClient] = None) -> List[bool]:
+        """Write back many analyses over one aiohttp session, in input order"""
+        if client is None:
+            async with AsyncMCPJiraClient(self.jira_client) as client:
+                return await self.update_jira_many_async(results, assign_to, client)
+        # The connector's limit caps open sockets, so every write can be queued at once
+        return list(await asyncio.gather(
+            *(self.update_jira_with_analysis_async(r, assign_to, client) for r in results)))
 
 def main():
+    setup_logging()
     config = AgentConfig(language="java", max_hours=4.0)
     agent = JiraAnalysisAgent(config)
     result = agent.analyze_issue("DL-123")
@@ -6,9 +6,12 @@ from fastapi import FastAPI, HTTPException, Header
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel
 from typing import Optional
-from src.agent import JiraAnalysisAgent, AgentConfig
+from src.agent import JiraAnalysisAgent, AgentConfig, setup_logging
 import base64
 import os
+import sys
+
+setup_logging()
 
 app = FastAPI(
     title="Jira Analysis Agent API",
@@ -175,18 +178,20 @@ async def health_check():
 def start():
     """Start the API server - can be called from anywhere"""
     import uvicorn
-    print("\n" + "="*60)
-    print("  🚀 Starting Jira Analysis Agent API")
-    print("="*60)
-    print("\n📍 API Endpoints:")
-    print("   • Health Check:  http://localhost:8000/")
-    print("   • API Docs:      http://localhost:8000/docs")
-    print("   • Health Status: http://localhost:8000/health")
-    print("   • Analyze Issue: http://localhost:8000/analyze (POST)")
-    print("\n⚡ Server starting on http://localhost:8000")
-    print("📖 Interactive docs available at http://localhost:8000/docs")
-    print("\n✨ Press Ctrl+C to stop the server\n")
-    print("="*60 + "\n")
+    sys.stdout.write(
+        "\n" + "="*60 + "\n"
+        "  🚀 Starting Jira Analysis Agent API\n"
+        + "="*60 + "\n"
+        "\n📍 API Endpoints:\n"
+        "   • Health Check:  http://localhost:8000/\n"
+        "   • API Docs:      http://localhost:8000/docs\n"
+        "   • Health Status: http://localhost:8000/health\n"
+        "   • Analyze Issue: http://localhost:8000/analyze (POST)\n"
+        "\n⚡ Server starting on http://localhost:8000\n"
+        "📖 Interactive docs available at http://localhost:8000/docs\n"
+        "\n✨ Press Ctrl+C to stop the server\n\n"
+        + "="*60 + "\n\n"
+    )
     
     # Use import string for reload to work properly
     uvicorn.run("web_api:app", host="0.0.0.0", port=8000, reload=True)